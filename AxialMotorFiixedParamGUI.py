@@ -1,13 +1,147 @@
 import sys
 import math
+import re
+from functools import lru_cache
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFormLayout, QGridLayout, QHBoxLayout
-from PyQt5.QtGui import QPainter, QColor, QPen
-from AxialMotorFixedParam import AxialMotorDesign
+from PyQt5.QtCore import Qt, QLocale, QRectF, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath, QPixmap, QDoubleValidator, QIntValidator
+from AxialMotorFixedParam import AxialMotorDesign, INNER_RADIUS_RATIO
+
+_NUM_RE = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+_MAX_MARKERS = 720
+
+_RAW_DEFAULTS = {
+    "Number of Coils": 12,
+    "Number of Turns": None,
+    "Input Voltage (V)": 12,
+    "Outer Radius (m)": 0.127,  # 5 inches converted to meters
+    "Desired Torque (N-m)": 5.94,
+    "ESC Frequency (Hz)": 50,
+    "Magnetic Flux Density (T)": 0.6
+}
+_DEFAULTS_STR = {k: ("" if v is None else str(v)) for k, v in _RAW_DEFAULTS.items()}
+
+@lru_cache(maxsize=32)
+def _unit_circle(num_coils):
+    """
+    Unit-circle (cos, sin) pairs for evenly spaced coils.
+    """
+    step_rad = 2.0 * math.pi / num_coils
+    cos = math.cos
+    sin = math.sin
+    return tuple((cos(i * step_rad), sin(i * step_rad)) for i in range(num_coils))
+
+def _coil_xy(num_coils, width, height, radius_outer):
+    """
+    Top-left corners of the coil markers placed around the outer ring.
+    """
+    r = radius_outer * 0.9
+    return tuple((int(width + r * ux - 5), int(height + r * uy - 5)) for ux, uy in _unit_circle(num_coils))
+
+class _CalcSignals(QObject):
+    finished = pyqtSignal(dict)
+
+class _CalcRunnable(QRunnable):
+    def __init__(self, parameters):
+        super().__init__()
+        self.parameters = parameters
+        self.signals = _CalcSignals()
+
+    def run(self):
+        try:
+            results = AxialMotorDesign(**self.parameters).get_calculations()
+        except Exception as e:
+            # Report every failure back so the GUI thread can re-enable the button
+            results = {"error": str(e)}
+        self.signals.finished.emit(results)
+
+class VisualizationWidget(QWidget):
+    def __init__(self, get_num_coils, parent=None):
+        super().__init__(parent)
+        self.get_num_coils = get_num_coils
+        self.setMinimumSize(300, 300)
+
+        self._pen = QPen(QColor(0, 0, 0))
+        self._brush_ring = QBrush(QColor(200, 200, 200))
+        self._brush_coil = QBrush(QColor(150, 150, 150))
+
+        self._marker_cache = (None, None)
+        self._pix_key = None
+        self._pix = None
+
+    def paintEvent(self, event):
+        # A blank field calculates with the default coil count, so sketch the same
+        text = self.get_num_coils().strip()
+        try:
+            num_coils = min(int(text), _MAX_MARKERS) if text else _RAW_DEFAULTS["Number of Coils"]
+        except ValueError:
+            num_coils = 0
+
+        # Render the sketch once per geometry and blit it on every other repaint
+        # Render at the screen's pixel ratio so scaled displays stay sharp; moving screens changes the key
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), num_coils, dpr)
+        if self._pix is None or self._pix_key != key:
+            pix = QPixmap(self.size() * dpr)
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            pix_painter = QPainter(pix)
+            self.drawMotorVisualization(pix_painter, num_coils)
+            pix_painter.end()
+            self._pix = pix
+            self._pix_key = key
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pix)
+
+    def drawMotorVisualization(self, painter, num_coils):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush_ring)
+
+        width = self.width() // 2
+        height = self.height() // 2
+        radius_outer = min(width, height) // 2 - 20
+        radius_inner = int(radius_outer * INNER_RADIUS_RATIO)
+
+        painter.drawEllipse(width - radius_outer, height - radius_outer, 2 * radius_outer, 2 * radius_outer)
+        painter.drawEllipse(width - radius_inner, height - radius_inner, 2 * radius_inner, 2 * radius_inner)
+
+        if num_coils <= 0:
+            return
+
+        # The 10 px markers look the same without antialiasing, which is much cheaper to rasterize
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(self._brush_coil)
+
+        # Marker positions only depend on the geometry, so reuse them between repaints
+        key = (num_coils, radius_outer, width, height)
+        if self._marker_cache[0] == key:
+            path = self._marker_cache[1]
+        else:
+            # Batch all markers into one path so they are drawn with a single call
+            path = QPainterPath()
+            for x, y in _coil_xy(num_coils, width, height, radius_outer):
+                path.addEllipse(QRectF(x, y, 10, 10))
+            self._marker_cache = (key, path)
+
+        painter.drawPath(path)
 
 class MainWindow(QWidget):
+    _PARAM_SPEC = (
+        ("coils", "Number of Coils"),
+        ("turns", "Number of Turns"),
+        ("input_voltage", "Input Voltage (V)"),
+        ("outer_radius", "Outer Radius (m)"),
+        ("desired_torque", "Desired Torque (N-m)"),
+        ("esc_frequency", "ESC Frequency (Hz)"),
+        ("magnetic_flux_density", "Magnetic Flux Density (T)")
+    )
+
     def __init__(self):
         super().__init__()
 
+        self._last_coils_text = None
         self.initUI()
 
     def initUI(self):
@@ -28,21 +162,25 @@ class MainWindow(QWidget):
             "ESC Frequency (Hz)": QLineEdit(),
             "Magnetic Flux Density (T)": QLineEdit()
         }
+        self._coil_text = self.inputs["Number of Coils"].text
 
-        self.defaults = {
-            "Number of Coils": 12,
-            "Number of Turns": None,
-            "Input Voltage (V)": 12,
-            "Outer Radius (m)": 0.127,  # 5 inches converted to meters
-            "Desired Torque (N-m)": 5.94,
-            "ESC Frequency (Hz)": 50,
-            "Magnetic Flux Density (T)": 0.6
-        }
+        self.defaults = _RAW_DEFAULTS
+
+        # Validators use the C locale without group separators, so they accept exactly what _NUM_RE parses
+        number_locale = QLocale.c()
+        number_locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        int_validator = QIntValidator(self)
+        int_validator.setLocale(number_locale)
+        double_validator = QDoubleValidator(self)
+        double_validator.setLocale(number_locale)
 
+        # Inputs are parsed as they are edited, so Calculate only reads the cached values
+        self._parsed = dict(self.defaults)
         for key, line_edit in self.inputs.items():
-            form_layout.addRow(QLabel(key), line_edit)
-            default_value = self.defaults[key]
-            line_edit.setText("" if default_value is None else str(default_value))
+            form_layout.addRow(key, line_edit)
+            line_edit.setValidator(int_validator if key == "Number of Coils" else double_validator)
+            line_edit.textChanged.connect(lambda text, key=key: self._cache_num(key, text))
+            line_edit.setText(_DEFAULTS_STR[key])
 
         left_layout.addLayout(form_layout)
 
@@ -74,75 +212,58 @@ class MainWindow(QWidget):
             results_layout.addWidget(label_result, row, 1)
             self.result_values[key] = label_result
             row += 1
+        self._result_items = tuple(self.result_values.items())
 
         left_layout.addLayout(results_layout)
         main_layout.addLayout(left_layout)
         main_layout.addLayout(right_layout)
 
-        self.visualization_widget = QWidget()
+        self.visualization_widget = VisualizationWidget(self._coil_text)
         right_layout.addWidget(self.visualization_widget)
         self.setLayout(main_layout)
 
-    def calculate(self):
-        parameter_mapping = {
-            "Number of Coils": "coils",
-            "Number of Turns": "turns",
-            "Input Voltage (V)": "input_voltage",
-            "Outer Radius (m)": "outer_radius",
-            "Desired Torque (N-m)": "desired_torque",
-            "ESC Frequency (Hz)": "esc_frequency",
-            "Magnetic Flux Density (T)": "magnetic_flux_density"
-        }
-
-        parameters = {}
-        for key, line_edit in self.inputs.items():
-            try:
-                text_value = line_edit.text()
-                if key == "Number of Turns" and text_value == "":
-                    parameters[parameter_mapping[key]] = None
-                else:
-                    parameters[parameter_mapping[key]] = float(text_value)
-            except ValueError:
-                parameters[parameter_mapping[key]] = self.defaults[key]
-
-        try:
-            motor = AxialMotorDesign(**parameters)
-            results = motor.get_calculations()
+        # Only the number of coils affects the sketch, so refresh it on live edits of that field
+        self.inputs["Number of Coils"].textChanged.connect(lambda _text: self.visualization_widget.update())
 
-            for key, value in results.items():
-                self.result_values[key].setText(value)
-        except ValueError as e:
-            # Display error message if any validation fails
-            self.result_values["Number of Poles"].setText(f"Error: {e}")
+    def _float_or_default(self, text, default):
+        # A blank "Number of Turns" falls through to its None default, which auto-calculates the turns
+        if not text:
+            return default
+        return float(text) if _NUM_RE.fullmatch(text) else default
 
-        self.visualization_widget.update()
+    def _cache_num(self, key, text):
+        self._parsed[key] = self._float_or_default(text, self.defaults[key])
 
-    def paintEvent(self, event):
-        painter = QPainter(self.visualization_widget)
-        self.drawMotorVisualization(painter)
+    def _build_parameters(self):
+        parsed = self._parsed
+        return {param: parsed[key] for param, key in self._PARAM_SPEC}
 
-    def drawMotorVisualization(self, painter):
-        painter.setRenderHint(QPainter.Antialiasing)
-        pen = QPen(QColor(0, 0, 0))
-        painter.setPen(pen)
-        painter.setBrush(QColor(200, 200, 200))
+    def calculate(self):
+        parameters = self._build_parameters()
 
-        width = self.visualization_widget.width() // 2
-        height = self.visualization_widget.height() // 2
-        radius_outer = min(width, height) // 2 - 20
-        radius_inner = int(radius_outer * 0.58)
+        runnable = _CalcRunnable(parameters)
+        runnable.signals.finished.connect(self._apply_results)
 
-        painter.drawEllipse(width - radius_outer, height - radius_outer, 2 * radius_outer, 2 * radius_outer)
-        painter.drawEllipse(width - radius_inner, height - radius_inner, 2 * radius_inner, 2 * radius_inner)
+        # Run the design off the GUI thread; presses are ignored until the results are back
+        self.calculate_button.setEnabled(False)
+        QThreadPool.globalInstance().start(runnable)
 
-        painter.setBrush(QColor(150, 150, 150))
-        num_coils = int(self.inputs["Number of Coils"].text())
-        angle_step = 360 / num_coils
-        for i in range(num_coils):
-            angle = i * angle_step
-            x = width + radius_outer * 0.9 * math.cos(math.radians(angle))
-            y = height + radius_outer * 0.9 * math.sin(math.radians(angle))
-            painter.drawEllipse(int(x - 5), int(y - 5), 10, 10)
+    def _apply_results(self, results):
+        try:
+            if "error" in results:
+                # Display error message if any validation fails
+                self.result_values["Number of Poles"].setText(f"Error: {results['error']}")
+            else:
+                for key, label_result in self._result_items:
+                    value = results.get(key, "")
+                    if label_result.text() != value:
+                        label_result.setText(value)
+        finally:
+            self.calculate_button.setEnabled(True)
+            coils_text = self._coil_text()
+            if coils_text != self._last_coils_text:
+                self.visualization_widget.update()
+                self._last_coils_text = coils_text
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
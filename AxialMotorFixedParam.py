@@ -1,11 +1,51 @@
 import math
+from functools import lru_cache
+
+SQRT3 = math.sqrt(3.0)
+INV_SQRT3 = 1.0 / SQRT3
+TWO_PI = 2.0 * math.pi
+HALF_PI = math.pi / 2.0
+INNER_RADIUS_RATIO = 0.58  # Optimal r_i / r_o ratio
+
+@lru_cache(maxsize=4096, typed=True)
+def _compute_core(coils, input_voltage, outer_radius, desired_torque, esc_frequency, turns, magnetic_flux_density):
+    """
+    Derived quantities for one set of inputs, memoized so re-evaluating a design is a lookup.
+    Returns (r_i, A_rotor, r_av, τ, B_m, N_ph, required_current, total_torque).
+    """
+    r_o = outer_radius
+    r_i = outer_radius * INNER_RADIUS_RATIO
+
+    A_rotor = math.pi * (r_o**2 - r_i**2)  # A_rotor = π * (r_o^2 - r_i^2)
+    r_av = (r_o + r_i) / 2
+    τ = desired_torque / (A_rotor * r_av)  # τ = T / (A_rotor * r_av)
+    B_m = HALF_PI * magnetic_flux_density
+
+    if turns is not None:
+        N_ph = turns
+    else:
+        A_coil = A_rotor / coils  # Assuming the coil area is the rotor area divided by the number of coils
+        omega_e = esc_frequency * TWO_PI  # Convert to rad/s
+        e_ph = input_voltage * INV_SQRT3  # Line-to-neutral voltage for Y connection
+        N_ph = e_ph / (A_coil * omega_e * B_m)  # N_ph = e_ph / (A_coil * ω_e * B_m)
+
+    T_per_phase = desired_torque / 3  # Assume torque is equally distributed in three phases
+    required_current = T_per_phase / (B_m * N_ph * r_av)
+    total_torque = τ * A_rotor * r_av
+    return r_i, A_rotor, r_av, τ, B_m, N_ph, required_current, total_torque
 
 class AxialMotorDesign:
+    __slots__ = (
+        "coils", "input_voltage", "outer_radius", "inner_radius", "desired_torque", "esc_frequency",
+        "turns", "magnetic_flux_density", "poles", "magnets", "min_rpm",
+        "rotor_area", "r_av", "airgap_shear_stress", "peak_flux_density", "coil_turns",
+        "required_current", "total_torque"
+    )
+
     def __init__(self, coils, input_voltage, outer_radius, desired_torque, esc_frequency, turns=None, magnetic_flux_density=0.6):
         self.coils = self.validate_coils(coils)
         self.input_voltage = input_voltage
         self.outer_radius = outer_radius
-        self.inner_radius = outer_radius * 0.58  # Optimal ratio
         self.desired_torque = desired_torque
         self.esc_frequency = esc_frequency
         self.turns = turns
@@ -13,6 +53,9 @@ class AxialMotorDesign:
         self.poles = self.calculate_poles()
         self.magnets = self.calculate_magnets()
         self.min_rpm = self.calculate_min_rpm()
+        (self.inner_radius, self.rotor_area, self.r_av, self.airgap_shear_stress, self.peak_flux_density,
+         self.coil_turns, self.required_current, self.total_torque) = _compute_core(
+            coils, input_voltage, outer_radius, desired_torque, esc_frequency, turns, magnetic_flux_density)
 
     def validate_coils(self, coils):
         """
@@ -33,10 +76,7 @@ class AxialMotorDesign:
         Determine the appropriate number of magnets based on the poles.
         The number of magnets should be the next number up that is divisible by 4.
         """
-        magnets = self.poles * 2
-        while magnets % 4 != 0:
-            magnets += 1
-        return magnets
+        return ((self.poles * 2 + 3) // 4) * 4
 
     def calculate_min_rpm(self):
         """
@@ -49,60 +89,94 @@ class AxialMotorDesign:
         Calculate the active surface area of the rotor.
         Equation: A_rotor = π * (r_o^2 - r_i^2)
         """
-        return math.pi * (self.outer_radius**2 - self.inner_radius**2)
+        return self.rotor_area
 
     def calculate_airgap_shear_stress(self):
         """
         Calculate the airgap shear stress (τ).
         Equation: τ = T / (A_rotor * r_av)
         """
-        A_rotor = self.calculate_rotor_area()
-        r_av = (self.outer_radius + self.inner_radius) / 2
-        return self.desired_torque / (A_rotor * r_av)
+        return self.airgap_shear_stress
 
     def calculate_peak_flux_density(self):
         """
         Calculate the peak flux density (B_m).
         """
-        return self.magnetic_flux_density / (2 / math.pi)
+        return self.peak_flux_density
 
     def calculate_number_of_coil_turns(self):
         """
         Calculate the number of turns per coil if not provided.
         Equation: N_ph = e_ph / (A_coil * ω_e * B_m)
         """
-        if self.turns is not None:
-            return self.turns
-
-        A_rotor = self.calculate_rotor_area()
-        A_coil = A_rotor / self.coils  # Assuming the coil area is the rotor area divided by the number of coils
-        B_m = self.calculate_peak_flux_density()
-        omega_e = self.esc_frequency * 2 * math.pi  # Convert to rad/s
-        e_ph = self.input_voltage / math.sqrt(3)  # Line-to-neutral voltage for Y connection
-        N_ph = e_ph / (A_coil * omega_e * B_m)
-        return N_ph
+        return self.coil_turns
 
     def calculate_required_current(self):
         """
         Calculate the required current to produce the desired torque.
         """
-        T_per_phase = self.desired_torque / 3  # Assume torque is equally distributed in three phases
-        B_m = self.calculate_peak_flux_density()
-        r_av = (self.outer_radius + self.inner_radius) / 2
-        Z = self.calculate_number_of_coil_turns()
-        required_current = T_per_phase / (B_m * Z * r_av)
-        return required_current
+        return self.required_current
 
     def calculate_total_torque(self):
         """
         Calculate the total torque based on design parameters.
         """
-        B_m = self.calculate_peak_flux_density()
-        A_rotor = self.calculate_rotor_area()
-        r_av = (self.outer_radius + self.inner_radius) / 2
-        τ = self.calculate_airgap_shear_stress()
-        T = τ * A_rotor * r_av
-        return T
+        return self.total_torque
+
+    @classmethod
+    def sweep(cls, coils, input_voltage, outer_radius, desired_torque, esc_frequency, turns=None, magnetic_flux_density=0.6):
+        """
+        Evaluate many designs at once for parameter studies.
+        Each argument may be a scalar or a NumPy array; they are broadcast against each other and
+        the results are returned as unformatted arrays under the same keys as get_calculations.
+        Every result is an ndarray of the broadcast shape, so all-scalar inputs give 0-d arrays.
+        A turns value of None or NaN auto-calculates the turns for that design, and degenerate
+        designs (e.g. zero ESC frequency) give inf/nan instead of raising.
+        """
+        import numpy as np  # Only needed for batch studies, so the scalar path stays dependency-free
+
+        if turns is None:
+            turns = np.nan
+        coils, V, r_o, T, fe, N_in, B = np.broadcast_arrays(*(
+            np.asarray(a, dtype=np.float64)
+            for a in (coils, input_voltage, outer_radius, desired_torque, esc_frequency, turns, magnetic_flux_density)
+        ))
+        if np.any(coils % 3 != 0):
+            raise ValueError("The number of coils must be divisible by 3.")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            poles = (coils // 3) * 2
+            magnets = ((poles * 2 + 3) // 4) * 4
+            r_i = r_o * INNER_RADIUS_RATIO
+            min_rpm = (fe * 60) / (poles / 2)
+            A_rotor = np.pi * (r_o**2 - r_i**2)
+            r_av = (r_o + r_i) / 2
+            τ = T / (A_rotor * r_av)
+            B_m = HALF_PI * B
+            auto = np.isnan(N_in)
+            if auto.any():
+                N_auto = (V * INV_SQRT3) / ((A_rotor / coils) * (fe * TWO_PI) * B_m)
+                N_ph = np.where(auto, N_auto, N_in)
+            else:
+                N_ph = np.array(N_in)  # Copy; N_in is a view of the caller's input
+            required_current = (T / 3) / (B_m * N_ph * r_av)
+            total_torque = τ * A_rotor * r_av
+
+        results = {
+            "Number of Poles": poles,
+            "Number of Magnets": magnets,
+            "Inner Radius (m)": r_i,
+            "Outer Radius (m)": r_o.copy(),
+            "Rotor Area (m^2)": A_rotor,
+            "Airgap Shear Stress (N/m^2)": τ,
+            "Minimum RPM": min_rpm,
+            "Peak Flux Density (T)": B_m,
+            "Number of Coil Turns": N_ph,
+            "Total Torque (N-m)": total_torque,
+            "Required Current (A)": required_current
+        }
+        # Arithmetic on 0-d arrays yields NumPy scalars; convert those back so every output has one type
+        return {key: np.asarray(value) for key, value in results.items()}
 
     def format_value(self, value):
         return f"{value:.5f}"
@@ -111,17 +185,18 @@ class AxialMotorDesign:
         """
         Get all calculations as a dictionary.
         """
+        fmt = "{:.5f}".format
         calculations = {
-            "Number of Poles": self.format_value(self.poles),
-            "Number of Magnets": self.format_value(self.magnets),
-            "Inner Radius (m)": self.format_value(self.inner_radius),
-            "Outer Radius (m)": self.format_value(self.outer_radius),
-            "Rotor Area (m^2)": self.format_value(self.calculate_rotor_area()),
-            "Airgap Shear Stress (N/m^2)": self.format_value(self.calculate_airgap_shear_stress()),
-            "Minimum RPM": self.format_value(self.min_rpm),
-            "Peak Flux Density (T)": self.format_value(self.calculate_peak_flux_density()),
-            "Number of Coil Turns": self.format_value(self.calculate_number_of_coil_turns()),
-            "Total Torque (N-m)": self.format_value(self.calculate_total_torque()),
-            "Required Current (A)": self.format_value(self.calculate_required_current())
+            "Number of Poles": fmt(self.poles),
+            "Number of Magnets": fmt(self.magnets),
+            "Inner Radius (m)": fmt(self.inner_radius),
+            "Outer Radius (m)": fmt(self.outer_radius),
+            "Rotor Area (m^2)": fmt(self.rotor_area),
+            "Airgap Shear Stress (N/m^2)": fmt(self.airgap_shear_stress),
+            "Minimum RPM": fmt(self.min_rpm),
+            "Peak Flux Density (T)": fmt(self.peak_flux_density),
+            "Number of Coil Turns": fmt(self.coil_turns),
+            "Total Torque (N-m)": fmt(self.total_torque),
+            "Required Current (A)": fmt(self.required_current)
         }
         return calculations
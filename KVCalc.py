@@ -1,5 +1,6 @@
 import sys
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QFormLayout
+from KVCalcCore import kv_new_turns
 
 class KVCalculatorSimple(QWidget):
     def __init__(self):
@@ -33,19 +34,19 @@ class KVCalculatorSimple(QWidget):
 
     def calculate(self):
         try:
-            original_kv = 62.5  # default original KV rating (RPM/V)
-            original_turns = 30  # default original number of turns
-
             desired_rpm = float(self.inputs["Desired RPM"].text())
             voltage = float(self.inputs["Voltage (V)"].text())
-
-            new_kv = desired_rpm / voltage
-            ratio = new_kv / original_kv
-            new_turns = int(round(original_turns / ratio))
-
-            self.result_label.setText(f"New Number of Turns: {new_turns}")
         except ValueError:
             self.result_label.setText("Invalid input. Please enter numeric values.")
+            return
+
+        try:
+            new_turns = kv_new_turns(desired_rpm, voltage)
+        except ValueError as e:
+            self.result_label.setText(f"Invalid input. {e}")
+            return
+
+        self.result_label.setText(f"New Number of Turns: {new_turns}")
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -0,0 +1,27 @@
+import math
+
+def kv_new_turns(desired_rpm, voltage, original_kv=62.5, original_turns=30):
+    """
+    Number of turns that gives the desired RPM at the given voltage.
+    Equation: N_new = N_orig / ((RPM / V) / KV_orig) = N_orig * KV_orig * V / RPM
+    """
+    if not (desired_rpm > 0 and math.isfinite(desired_rpm)):
+        raise ValueError("Desired RPM must be a positive number.")
+    if not (voltage > 0 and math.isfinite(voltage)):
+        raise ValueError("Voltage must be a positive number.")
+    return int(round(original_turns * original_kv * voltage / desired_rpm))
+
+def kv_new_turns_vec(desired_rpm, voltage, original_kv=62.5, original_turns=30):
+    """
+    Array version of kv_new_turns for sweeps; arguments are broadcast against each other.
+    """
+    import numpy as np  # Only needed for sweeps, so the scalar path stays dependency-free
+
+    desired_rpm = np.asarray(desired_rpm, dtype=np.float64)
+    voltage = np.asarray(voltage, dtype=np.float64)
+    if not np.all((desired_rpm > 0) & np.isfinite(desired_rpm)):
+        raise ValueError("Desired RPM must be a positive number.")
+    if not np.all((voltage > 0) & np.isfinite(voltage)):
+        raise ValueError("Voltage must be a positive number.")
+    turns = original_turns * original_kv * voltage / desired_rpm
+    return np.rint(turns).astype(np.int32)